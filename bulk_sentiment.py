@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Vectorized VADER sentiment scoring for bulk runs.
+
+BulkSentimentScorer reproduces SentimentIntensityAnalyzer.polarity_scores for a
+whole batch of texts at once. Each text is tokenized exactly once, tokens are
+mapped to integer ids through a token-to-index table seeded from the VADER
+lexicon, and the lexicon valences, negation, intensifier ("very", "kind of"),
+ALL-CAPS, "no"/"least" and special-idiom rules are applied as NumPy array
+operations over every token in the batch.
+
+Compound scores are guaranteed to match polarity_scores within
+COMPOUND_TOLERANCE (one unit of VADER's 4-decimal rounding). The per-token
+arithmetic runs in the same order as VADER's and results are rounded as
+Python floats, so on the headline corpora and on randomized lexicon text all
+four fields come out identical. The contrastive "but" rule depends on
+list.index() lookups in VADER, so it is replayed exactly in Python for the
+(few) texts that contain "but".
+
+Usage:
+    python bulk_sentiment.py [headlines.json ...]
+
+Checks bulk scores against polarity_scores over the given headline files
+(default: data/all_headlines.json) and exits non-zero if any compound score
+differs by more than COMPOUND_TOLERANCE or any neg/neu/pos ratio differs.
+"""
+
+import json
+import string
+import sys
+import time
+
+import numpy as np
+from vaderSentiment.vaderSentiment import (
+    BOOSTER_DICT, C_INCR, N_SCALAR, NEGATE, SPECIAL_CASES, SentimentIntensityAnalyzer
+)
+
+# Maximum allowed |bulk - polarity_scores| for compound scores
+COMPOUND_TOLERANCE = 1e-4
+
+# Words the VADER rules compare against directly
+RULE_WORDS = ('no', 'or', 'nor', 'kind', 'of', 'never', 'so', 'this', 'without', 'doubt', 'least', 'at', 'very', 'but')
+
+
+def _words_and_emoticons(text):
+    """VADER tokenization: split on whitespace, strip punctuation unless that leaves <= 2 chars"""
+    punctuation = string.punctuation
+    return [token if len(stripped := token.strip(punctuation)) <= 2 else stripped for token in text.split()]
+
+
+def _is_negation(word):
+    """vaderSentiment.negated() for a single lowercased word"""
+    return word in NEGATE or "n't" in word
+
+
+def _but_check(words_lower, sentiments):
+    """VADER's contrastive 'but' rule, replayed verbatim (it relies on list.index lookups)"""
+    bi = words_lower.index('but')
+    for sentiment in sentiments:
+        si = sentiments.index(sentiment)
+        if si < bi:
+            sentiments.pop(si)
+            sentiments.insert(si, sentiment * 0.5)
+        elif si > bi:
+            sentiments.pop(si)
+            sentiments.insert(si, sentiment * 1.5)
+    return sentiments
+
+
+class BulkSentimentScorer:
+    """Batch equivalent of SentimentIntensityAnalyzer.polarity_scores"""
+
+    def __init__(self, analyzer=None):
+        self.analyzer = analyzer or SentimentIntensityAnalyzer()
+        self.emoji_chars = {e for e in self.analyzer.emojis if len(e) == 1}
+
+        # Token-to-index table built once from the lexicon and rule words;
+        # id 0 is the "no token" sentinel used past text boundaries
+        self.vocab = {'': 0}
+        for word in self.analyzer.lexicon:
+            self.vocab.setdefault(word, len(self.vocab))
+        for phrase in (*SPECIAL_CASES, *BOOSTER_DICT, *RULE_WORDS):
+            for word in phrase.split():
+                self.vocab.setdefault(word, len(self.vocab))
+
+        words = list(self.vocab)
+        self.valence = np.array([self.analyzer.lexicon.get(w, 0.0) for w in words])
+        self.in_lexicon = np.array([w in self.analyzer.lexicon for w in words], dtype=bool)
+        self.booster = np.array([BOOSTER_DICT.get(w, 0.0) for w in words])
+        self.is_booster = np.array([w in BOOSTER_DICT for w in words], dtype=bool)
+        self.negating = np.array([_is_negation(w) for w in words], dtype=bool)
+        self.ids = {word: self.vocab[word] for word in RULE_WORDS}
+
+        self.special_cases = self._phrase_table(SPECIAL_CASES)
+        self.booster_phrases = [
+            (ids, value) for ids, value in self._phrase_table(BOOSTER_DICT) if len(ids) == 2
+        ]
+
+    def _phrase_table(self, phrases):
+        return [(tuple(self.vocab[w] for w in phrase.split()), value) for phrase, value in phrases.items()]
+
+    def _strip_emojis(self, text):
+        """Replace emojis with their descriptions exactly as polarity_scores does"""
+        if self.emoji_chars.isdisjoint(text):
+            return text.strip()
+
+        text_no_emoji = ""
+        prev_space = True
+        for chr in text:
+            if chr in self.emoji_chars:
+                if not prev_space:
+                    text_no_emoji += ' '
+                text_no_emoji += self.analyzer.emojis[chr]
+                prev_space = False
+            else:
+                text_no_emoji += chr
+                prev_space = chr == ' '
+        return text_no_emoji.strip()
+
+    def polarity_scores_batch(self, texts):
+        """Score a batch of texts, returning one polarity_scores-style dict per text"""
+        texts = [self._strip_emojis(text) for text in texts]
+        doc_count = len(texts)
+
+        # Tokenize every text once into flat arrays; tokens outside the lexicon
+        # table get ids in a per-batch overflow table so the shared one never grows
+        token_ids, upper, doc_lengths = [], [], []
+        vocab_get = self.vocab.get
+        overflow = {}
+        base_size = len(self.vocab)
+        for text in texts:
+            words = _words_and_emoticons(text)
+            doc_lengths.append(len(words))
+            for w in words:
+                lower = w.lower()
+                token_id = vocab_get(lower)
+                if token_id is None:
+                    token_id = overflow.setdefault(lower, base_size + len(overflow))
+                token_ids.append(token_id)
+                upper.append(w.isupper())
+
+        if not token_ids:
+            return [{'neg': 0.0, 'neu': 0.0, 'pos': 0.0, 'compound': 0.0} for _ in texts]
+
+        tok = np.array(token_ids, dtype=np.int64)
+        upper = np.array(upper, dtype=bool)
+        lengths = np.array(doc_lengths, dtype=np.int64)
+        doc = np.repeat(np.arange(doc_count), lengths)
+        starts = np.cumsum(lengths) - lengths
+        pos = np.arange(len(tok)) - starts[doc]
+
+        # Overflow tokens carry no lexicon or booster valence, only possible negation ("n't")
+        extra = len(overflow)
+        valence = np.concatenate([self.valence, np.zeros(extra)])
+        in_lexicon = np.concatenate([self.in_lexicon, np.zeros(extra, dtype=bool)])
+        booster = np.concatenate([self.booster, np.zeros(extra)])
+        is_booster = np.concatenate([self.is_booster, np.zeros(extra, dtype=bool)])
+        negating = np.concatenate([self.negating, np.array([_is_negation(w) for w in overflow], dtype=bool)])
+
+        # Neighbouring tokens within the same text (sentinel 0 outside it)
+        def shifted(values, k, fill):
+            out = np.full_like(values, fill)
+            if k > 0:
+                out[k:] = values[:-k]
+                out[pos < k] = fill
+            else:
+                out[:k] = values[-k:]
+                out[pos - k >= lengths[doc]] = fill
+            return out
+
+        prev = {k: shifted(tok, k, 0) for k in (1, 2, 3)}
+        prev_upper = {k: shifted(upper, k, False) for k in (1, 2, 3)}
+        next1, next2 = shifted(tok, -1, 0), shifted(tok, -2, 0)
+        ids = self.ids
+
+        # Some but not all words in ALL CAPS
+        caps_per_doc = np.bincount(doc, weights=upper, minlength=doc_count)
+        cap_diff = ((caps_per_doc > 0) & (caps_per_doc < lengths))[doc]
+
+        # Lexicon valence, with "no" as a negator of the next lexicon word
+        lex_valence = valence[tok]
+        v = lex_valence.copy()
+        v = np.where((tok == ids['no']) & in_lexicon[next1], 0.0, v)
+        negated_by_no = ((prev[1] == ids['no']) | (prev[2] == ids['no'])
+                         | ((prev[3] == ids['no']) & ((prev[1] == ids['or']) | (prev[1] == ids['nor']))))
+        v = np.where(negated_by_no, lex_valence * N_SCALAR, v)
+
+        # ALL CAPS emphasis
+        v = np.where(upper & cap_diff, np.where(v > 0, v + C_INCR, v - C_INCR), v)
+
+        # Intensifiers and negations in the three preceding words
+        so_or_this = {k: (prev[k] == ids['so']) | (prev[k] == ids['this']) for k in (1, 2)}
+        for start_i, damp in ((0, 1.0), (1, 0.95), (2, 0.9)):
+            p = prev[start_i + 1]
+            applies = (pos > start_i) & ~in_lexicon[p]
+
+            scalar = np.where(v < 0, -booster[p], booster[p])
+            capped_booster = is_booster[p] & prev_upper[start_i + 1] & cap_diff
+            scalar = np.where(capped_booster, np.where(v > 0, scalar + C_INCR, scalar - C_INCR), scalar)
+            v = np.where(applies, v + scalar * damp, v)
+
+            if start_i == 0:
+                factor = np.where(negating[p], N_SCALAR, 1.0)
+            elif start_i == 1:
+                emphasis = (prev[2] == ids['never']) & so_or_this[1]
+                no_doubt = (prev[2] == ids['without']) & (prev[1] == ids['doubt'])
+                factor = np.where(emphasis, 1.25, np.where(no_doubt, 1.0, np.where(negating[p], N_SCALAR, 1.0)))
+            else:
+                emphasis = ((prev[3] == ids['never']) & so_or_this[2]) | so_or_this[1]
+                no_doubt = (prev[3] == ids['without']) & ((prev[2] == ids['doubt']) | (prev[1] == ids['doubt']))
+                factor = np.where(emphasis, 1.25, np.where(no_doubt, 1.0, np.where(negating[p], N_SCALAR, 1.0)))
+            v = np.where(applies, v * factor, v)
+
+            if start_i == 2:
+                v = np.where(applies, self._special_idioms(v, tok, prev, next1, next2), v)
+
+        # "least" as a negation (but not "at least" / "very least")
+        least = ~in_lexicon[prev[1]] & (prev[1] == ids['least'])
+        least_far = (pos > 1) & least
+        least_negates = least_far & (prev[2] != ids['at']) & (prev[2] != ids['very'])
+        least_negates |= ~least_far & (pos > 0) & least
+        v = np.where(least_negates, v * N_SCALAR, v)
+
+        # Only lexicon words that are not themselves modifiers carry sentiment
+        skip = is_booster[tok] | ((tok == ids['kind']) & (next1 == ids['of']))
+        sentiments = np.where(in_lexicon[tok] & ~skip, v, 0.0)
+
+        # Contrastive "but" (replayed exactly for texts that contain it)
+        for d in np.unique(doc[tok == ids['but']]):
+            lo, hi = starts[d], starts[d] + lengths[d]
+            words_lower = [w.lower() for w in _words_and_emoticons(texts[d])]
+            sentiments[lo:hi] = _but_check(words_lower, sentiments[lo:hi].tolist())
+
+        return self._score_valence(texts, doc, doc_count, lengths, sentiments)
+
+    def _special_idioms(self, v, tok, prev, next1, next2):
+        """Vectorized SentimentIntensityAnalyzer._special_idioms_check"""
+        def matches(seq, ids):
+            cond = np.ones(len(tok), dtype=bool)
+            for column, token_id in zip(seq, ids):
+                cond &= column == token_id
+            return cond
+
+        p1, p2, p3 = prev[1], prev[2], prev[3]
+        matched = np.zeros(len(tok), dtype=bool)
+        for seq in ((p1, tok), (p2, p1, tok), (p2, p1), (p3, p2, p1), (p3, p2)):
+            for ids, value in self.special_cases:
+                if len(ids) == len(seq):
+                    cond = ~matched & matches(seq, ids)
+                    v = np.where(cond, value, v)
+                    matched |= cond
+
+        for seq in ((tok, next1), (tok, next1, next2)):
+            for ids, value in self.special_cases:
+                if len(ids) == len(seq):
+                    v = np.where(matches(seq, ids), value, v)
+
+        for seq in ((p3, p2), (p2, p1)):
+            for ids, value in self.booster_phrases:
+                v = np.where(matches(seq, ids), v + value, v)
+        return v
+
+    @staticmethod
+    def _score_valence(texts, doc, doc_count, lengths, sentiments):
+        """Vectorized SentimentIntensityAnalyzer.score_valence over all texts"""
+        sum_s = np.bincount(doc, weights=sentiments, minlength=doc_count)
+
+        # Punctuation emphasis from "!" (up to 4) and "?" (2 or more)
+        ep = np.array([min(text.count('!'), 4) for text in texts]) * 0.292
+        qm_count = np.array([text.count('?') for text in texts])
+        qm = np.where(qm_count > 3, 0.96, np.where(qm_count > 1, qm_count * 0.18, 0.0))
+        amplifier = ep + qm
+
+        sum_s = np.where(sum_s > 0, sum_s + amplifier, np.where(sum_s < 0, sum_s - amplifier, sum_s))
+        compound = np.clip(sum_s / np.sqrt(sum_s * sum_s + 15), -1.0, 1.0)
+
+        pos_sum = np.bincount(doc, weights=np.where(sentiments > 0, sentiments + 1, 0.0), minlength=doc_count)
+        neg_sum = np.bincount(doc, weights=np.where(sentiments < 0, sentiments - 1, 0.0), minlength=doc_count)
+        neu_count = np.bincount(doc, weights=sentiments == 0, minlength=doc_count)
+
+        pos_sum = np.where(pos_sum > np.abs(neg_sum), pos_sum + amplifier, pos_sum)
+        neg_sum = np.where(pos_sum < np.abs(neg_sum), neg_sum - amplifier, neg_sum)
+
+        total = pos_sum + np.abs(neg_sum) + neu_count
+        has_tokens = lengths > 0
+        safe_total = np.where(has_tokens, total, 1.0)
+
+        # Round with Python's round() so results are identical to polarity_scores
+        results = []
+        for d in range(doc_count):
+            if has_tokens[d]:
+                results.append({
+                    'neg': round(float(abs(neg_sum[d] / safe_total[d])), 3),
+                    'neu': round(float(abs(neu_count[d] / safe_total[d])), 3),
+                    'pos': round(float(abs(pos_sum[d] / safe_total[d])), 3),
+                    'compound': round(float(compound[d]), 4),
+                })
+            else:
+                results.append({'neg': 0.0, 'neu': 0.0, 'pos': 0.0, 'compound': 0.0})
+        return results
+
+
+def main():
+    paths = sys.argv[1:] or ['data/all_headlines.json']
+
+    texts = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for h in json.load(f)['headlines']:
+                # Same text construction as fetcher.fetch_rss_feeds / classify_sentiment_enhanced
+                full_text = f"{h['title']}. {h.get('summary', '')}"
+                texts.append(f"{full_text}. ")
+
+    analyzer = SentimentIntensityAnalyzer()
+    scorer = BulkSentimentScorer(analyzer)
+
+    start = time.perf_counter()
+    expected = [analyzer.polarity_scores(text) for text in texts]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = scorer.polarity_scores_batch(texts)
+    bulk_time = time.perf_counter() - start
+
+    diffs = [abs(a['compound'] - e['compound']) for a, e in zip(actual, expected)]
+    worst = max(diffs, default=0.0)
+    exact = sum(a == e for a, e in zip(actual, expected))
+
+    print(f"Texts scored: {len(texts)}")
+    print(f"polarity_scores: {scalar_time:.3f}s   bulk: {bulk_time:.3f}s")
+    print(f"Identical score dicts: {exact}/{len(texts)}")
+    print(f"Max compound difference: {worst:.6f} (tolerance {COMPOUND_TOLERANCE})")
+
+    failures = [
+        (text, a, e) for text, a, e in zip(texts, actual, expected)
+        if abs(a['compound'] - e['compound']) > COMPOUND_TOLERANCE
+        or any(a[key] != e[key] for key in ('neg', 'neu', 'pos'))
+    ]
+    if failures:
+        for text, a, e in failures:
+            print(f"  ❌ {a} != {e}: {text[:100]}")
+        sys.exit(1)
+    print("✅ Bulk scores match polarity_scores")
+
+
+if __name__ == "__main__":
+    main()
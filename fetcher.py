@@ -1,16 +1,23 @@
 import os
+import argparse
+import glob
 import json
 import time
 import hashlib
 import re
+import stat
+import tempfile
+from xml.etree import ElementTree
 from datetime import datetime, timedelta, timezone
 import nltk
 
 import feedparser
+import urllib3
 from dateutil import parser as dateparser
 
 # NLTK VADER setup
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from bulk_sentiment import BulkSentimentScorer
 
 # Ensure VADER lexicon is present
 try:
@@ -19,6 +26,7 @@ except LookupError:
     nltk.download('vader_lexicon')
 
 sia = SentimentIntensityAnalyzer()
+bulk_scorer = BulkSentimentScorer(sia)
 
 # --- Configuration ---
 ROLLING_DAYS = 7
@@ -28,83 +36,66 @@ LATEST_PATH = os.path.join(OUTPUT_DIR, 'latest.json')
 HISTORY_PATH = os.path.join(OUTPUT_DIR, 'history.json')
 ALL_HEADLINES_PATH = os.path.join(OUTPUT_DIR, 'all_headlines.json')
 
-# RSS feeds organized by region (same as before)
-FEEDS = [
-    # North America
-    {"name": "BBC News", "url": "http://feeds.bbci.co.uk/news/rss.xml", "region": "Global"},
-    {"name": "CNN", "url": "http://rss.cnn.com/rss/edition.rss", "region": "North America"},
-    {"name": "Reuters", "url": "https://feeds.reuters.com/reuters/topNews", "region": "Global"},
-    {"name": "AP News", "url": "https://feeds.apnews.com/apf-topnews", "region": "North America"},
-    {"name": "NPR", "url": "https://feeds.npr.org/1001/rss.xml", "region": "North America"},
-    {"name": "CBS News", "url": "https://www.cbsnews.com/latest/rss/main", "region": "North America"},
-    {"name": "ABC News", "url": "https://abcnews.go.com/abcnews/topstories", "region": "North America"},
-    {"name": "Fox News", "url": "http://feeds.foxnews.com/foxnews/latest", "region": "North America"},
-    {"name": "NBC News", "url": "http://feeds.nbcnews.com/nbcnews/public/news", "region": "North America"},
-    {"name": "USA Today", "url": "http://rssfeeds.usatoday.com/usatoday-NewsTopStories", "region": "North America"},
-    {"name": "Wall Street Journal", "url": "https://feeds.a.dj.com/rss/RSSWorldNews.xml", "region": "North America"},
-    {"name": "New York Times", "url": "https://rss.nytimes.com/services/xml/rss/nyt/World.xml", "region": "North America"},
-    {"name": "Washington Post", "url": "http://feeds.washingtonpost.com/rss/world", "region": "North America"},
-    {"name": "CBC News", "url": "https://www.cbc.ca/cmlink/rss-world", "region": "North America"},
-    {"name": "Toronto Star", "url": "https://www.thestar.com/feeds.articles.news.world.rss", "region": "North America"},
-    
-    # Europe
-    {"name": "The Guardian", "url": "https://www.theguardian.com/world/rss", "region": "Europe"},
-    {"name": "Financial Times", "url": "https://www.ft.com/?format=rss", "region": "Europe"},
-    {"name": "The Times", "url": "https://www.thetimes.co.uk/rss", "region": "Europe"},
-    {"name": "Independent", "url": "https://www.independent.co.uk/rss", "region": "Europe"},
-    {"name": "Telegraph", "url": "https://www.telegraph.co.uk/rss.xml", "region": "Europe"},
-    {"name": "Sky News", "url": "http://feeds.skynews.com/feeds/rss/world.xml", "region": "Europe"},
-    {"name": "Euronews", "url": "https://www.euronews.com/rss", "region": "Europe"},
-    {"name": "Deutsche Welle", "url": "https://rss.dw.com/xml/rss-en-all", "region": "Europe"},
-    {"name": "France 24", "url": "https://www.france24.com/en/rss", "region": "Europe"},
-    {"name": "RT News", "url": "https://www.rt.com/rss/news/", "region": "Europe"},
-    {"name": "Sputnik News", "url": "https://sputniknews.com/export/rss2/archive/index.xml", "region": "Europe"},
-    {"name": "Irish Times", "url": "https://www.irishtimes.com/cmlink/news-1.1319192", "region": "Europe"},
-    
-    # Asia-Pacific
-    {"name": "Al Jazeera English", "url": "https://www.aljazeera.com/xml/rss/all.xml", "region": "Middle East"},
-    {"name": "South China Morning Post", "url": "https://www.scmp.com/rss/91/feed", "region": "Asia-Pacific"},
-    {"name": "Japan Times", "url": "https://www.japantimes.co.jp/rss/feed/news", "region": "Asia-Pacific"},
-    {"name": "The Hindu", "url": "https://www.thehindu.com/news/national/?service=rss", "region": "Asia-Pacific"},
-    {"name": "Times of India", "url": "https://timesofindia.indiatimes.com/rssfeedstopstories.cms", "region": "Asia-Pacific"},
-    {"name": "Straits Times", "url": "https://www.straitstimes.com/news/singapore/rss.xml", "region": "Asia-Pacific"},
-    {"name": "Australian Broadcasting Corporation", "url": "https://www.abc.net.au/news/feed/51120/rss.xml", "region": "Asia-Pacific"},
-    {"name": "New Zealand Herald", "url": "https://www.nzherald.co.nz/arc/outboundfeeds/rss/section/1/", "region": "Asia-Pacific"},
-    {"name": "Korean Herald", "url": "http://www.koreaherald.com/rss/020701000000.xml", "region": "Asia-Pacific"},
-    {"name": "Channel News Asia", "url": "https://www.channelnewsasia.com/api/v1/rss-outbound-feed?_format=xml", "region": "Asia-Pacific"},
-    
-    # Middle East & Africa
-    {"name": "Jerusalem Post", "url": "https://www.jpost.com/rss/rssfeedsheadlines.aspx", "region": "Middle East"},
-    {"name": "Haaretz", "url": "https://www.haaretz.com/srv/haaretz-com-news-feed", "region": "Middle East"},
-    {"name": "Middle East Eye", "url": "https://www.middleeasteye.net/rss", "region": "Middle East"},
-    {"name": "Times of Israel", "url": "https://www.timesofisrael.com/feed/", "region": "Middle East"},
-    {"name": "Daily News Egypt", "url": "https://dailynewsegypt.com/feed/", "region": "Middle East"},
-    {"name": "News24 South Africa", "url": "https://www.news24.com/arc/outboundfeeds/rss/?outputType=xml", "region": "Africa"},
-    {"name": "AllAfrica", "url": "https://allafrica.com/tools/headlines/rdf/latest/headlines.rdf", "region": "Africa"},
-    {"name": "Daily Nation Kenya", "url": "https://nation.africa/kenya/rss", "region": "Africa"},
-    
-    # South America
-    {"name": "Buenos Aires Herald", "url": "https://www.buenosairesherald.com/rss", "region": "South America"},
-    {"name": "Brazil News", "url": "https://rss.cnn.com/rss/edition_americas.rss", "region": "South America"},
-    
-    # Business & Tech (Global)
-    {"name": "CNBC", "url": "https://www.cnbc.com/id/100003114/device/rss/rss.html", "region": "Global"},
-    {"name": "Bloomberg", "url": "https://feeds.bloomberg.com/markets/news.rss", "region": "Global"},
-    {"name": "MarketWatch", "url": "http://feeds.marketwatch.com/marketwatch/topstories/", "region": "Global"},
-    {"name": "Forbes", "url": "https://www.forbes.com/news/index.xml", "region": "Global"},
-    {"name": "TechCrunch", "url": "http://feeds.feedburner.com/TechCrunch/", "region": "Global"},
-    {"name": "The Verge", "url": "https://www.theverge.com/rss/index.xml", "region": "Global"},
-    {"name": "Wired", "url": "https://www.wired.com/feed/rss", "region": "Global"},
-    {"name": "Ars Technica", "url": "http://feeds.arstechnica.com/arstechnica/index", "region": "Global"},
-    {"name": "Engadget", "url": "https://www.engadget.com/rss.xml", "region": "Global"},
-    {"name": "Mashable", "url": "http://feeds.mashable.com/Mashable", "region": "Global"},
-    
-    # Sports (Global)
-    {"name": "ESPN", "url": "https://www.espn.com/espn/rss/news", "region": "Global"},
-    {"name": "Sports Illustrated", "url": "https://www.si.com/rss/si_topstories.rss", "region": "Global"},
-    {"name": "BBC Sport", "url": "http://feeds.bbci.co.uk/sport/rss.xml", "region": "Global"},
-    {"name": "Sky Sports", "url": "http://www.skysports.com/rss/12040", "region": "Global"},
-]
+# HTTP transport settings for feed downloads
+HTTP_CONNECT_TIMEOUT = 5.0   # seconds
+HTTP_READ_TIMEOUT = 20.0     # seconds
+HTTP_POOL_HOSTS = 64         # number of per-host connection pools kept alive
+HTTP_POOL_SIZE = 4           # keep-alive connections per host
+MAX_FEED_BYTES = 5 * 1024 * 1024  # cap on decoded feed body size
+FEED_CHUNK_BYTES = 16 * 1024      # read size for streaming feed parsing
+USER_AGENT = 'GoodNewsBadNews/1.0 (+https://github.com/orenplevin/GoodNewsBadNews)'
+
+# Stop reading a feed after this many consecutive already-known articles
+# (0 disables; override per feed with "known_streak_limit" in feeds.json,
+# e.g. for feeds that list oldest entries first)
+KNOWN_STREAK_LIMIT = 10
+
+# Streaming parser: namespaces whose elements are read; everything else
+# (media:, itunes:, dc:title, ...) is ignored so it cannot take over a field
+RSS_NAMESPACES = ('', 'http://purl.org/rss/1.0/', 'http://my.netscape.com/rdf/simple/0.9/')
+ATOM_NAMESPACES = ('http://www.w3.org/2005/Atom', 'http://purl.org/atom/ns#')
+CONTENT_NAMESPACE = 'http://purl.org/rss/1.0/modules/content/'
+DC_NAMESPACE = 'http://purl.org/dc/elements/1.1/'
+
+# Entry elements as (namespace, lowercased local name)
+FEED_ENTRY_TAGS = {(ns, 'item') for ns in RSS_NAMESPACES} | {(ns, 'entry') for ns in ATOM_NAMESPACES}
+
+# Entry children mapped to feedparser-style fields
+FEED_FIELD_TAGS = {
+    **{(ns, name): field for ns in RSS_NAMESPACES for name, field in [
+        ('title', 'title'), ('link', 'link'), ('guid', 'guid'),
+        ('description', 'summary'), ('pubdate', 'pubdate'),
+    ]},
+    **{(ns, name): field for ns in ATOM_NAMESPACES for name, field in [
+        ('title', 'title'), ('link', 'atom_link'), ('summary', 'summary'), ('content', 'content'),
+        ('published', 'published'), ('issued', 'issued'), ('updated', 'updated'), ('modified', 'modified'),
+    ]},
+    (CONTENT_NAMESPACE, 'encoded'): 'content',
+    (DC_NAMESPACE, 'date'): 'date',
+}
+
+# Date fields in priority order
+FEED_DATE_FIELDS = ('published', 'pubdate', 'date', 'issued', 'updated', 'modified')
+
+# Score sentiment with the vectorized bulk scorer once a run has this many new articles
+BULK_SENTIMENT_MIN = 200
+
+# Top-level output keys that change on every run and are ignored when
+# deciding whether an output file actually needs rewriting
+VOLATILE_KEYS = ('generated_at',)
+
+# RSS feed registry (list of {"name", "url", "region"} objects)
+FEEDS_PATH = 'feeds.json'
+
+# Partial article stores written by sharded fetch runs
+SHARD_DIR = os.path.join('data', 'shards')
+
+def load_feeds(path=FEEDS_PATH):
+    """Load the feed registry from the external config file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+FEEDS = load_feeds()
 
 # Enhanced topic classification with context patterns
 TOPIC_PATTERNS = {
@@ -267,37 +258,32 @@ REGION_PATTERNS = {
     }
 }
 
-def classify_sentiment_enhanced(title: str, summary: str = "") -> dict:
-    """Enhanced sentiment classification with context awareness"""
-    full_text = f"{title}. {summary}"
-    
-    # Get VADER scores
-    scores = sia.polarity_scores(full_text)
+# Context-aware sentiment adjustments applied on top of VADER
+POSITIVE_BOOSTERS = [re.compile(p) for p in [
+    r'\b(breakthrough|success|victory|achievement|progress|improvement|recovery|growth)',
+    r'\b(celebrates?|honors?|awards?|wins?|triumphs?)',
+    r'\b(peace|agreement|resolution|solution|cure)'
+]]
+
+NEGATIVE_BOOSTERS = [re.compile(p) for p in [
+    r'\b(crisis|disaster|tragedy|death|killing|war|conflict|attack)',
+    r'\b(fails?|collapse|crash|scandal|corruption|fraud)',
+    r'\b(emergency|urgent|critical|severe|devastating)'
+]]
+
+def adjust_sentiment(full_text: str, scores: dict) -> dict:
+    """Apply context boosters to VADER scores and label the result"""
     compound = scores.get('compound', 0.0)
     
     # Context-aware adjustments
     text_lower = full_text.lower()
     
-    # Boost positive sentiment for certain contexts
-    positive_boosters = [
-        r'\b(breakthrough|success|victory|achievement|progress|improvement|recovery|growth)',
-        r'\b(celebrates?|honors?|awards?|wins?|triumphs?)',
-        r'\b(peace|agreement|resolution|solution|cure)'
-    ]
-    
-    # Boost negative sentiment for certain contexts
-    negative_boosters = [
-        r'\b(crisis|disaster|tragedy|death|killing|war|conflict|attack)',
-        r'\b(fails?|collapse|crash|scandal|corruption|fraud)',
-        r'\b(emergency|urgent|critical|severe|devastating)'
-    ]
-    
-    for pattern in positive_boosters:
-        if re.search(pattern, text_lower):
+    for pattern in POSITIVE_BOOSTERS:
+        if pattern.search(text_lower):
             compound += 0.1
     
-    for pattern in negative_boosters:
-        if re.search(pattern, text_lower):
+    for pattern in NEGATIVE_BOOSTERS:
+        if pattern.search(text_lower):
             compound -= 0.1
     
     # Classify based on adjusted compound score
@@ -314,6 +300,27 @@ def classify_sentiment_enhanced(title: str, summary: str = "") -> dict:
         'scores': scores
     }
 
+def classify_sentiment_enhanced(title: str, summary: str = "") -> dict:
+    """Enhanced sentiment classification with context awareness"""
+    full_text = f"{title}. {summary}"
+    
+    # Get VADER scores
+    return adjust_sentiment(full_text, sia.polarity_scores(full_text))
+
+def classify_sentiment_batch(titles, summaries=None) -> list:
+    """Classify many articles at once, using the vectorized VADER scorer for large batches"""
+    if summaries is None:
+        summaries = [""] * len(titles)
+    
+    if len(titles) < BULK_SENTIMENT_MIN:
+        return [classify_sentiment_enhanced(t, s) for t, s in zip(titles, summaries)]
+    
+    full_texts = [f"{t}. {s}" for t, s in zip(titles, summaries)]
+    return [
+        adjust_sentiment(full_text, scores)
+        for full_text, scores in zip(full_texts, bulk_scorer.polarity_scores_batch(full_texts))
+    ]
+
 def classify_topic_enhanced(title: str, summary: str = "") -> str:
     """Enhanced topic classification using context patterns and keywords"""
     full_text = f"{title} {summary}".lower()
@@ -410,63 +417,329 @@ def parse_date(date_str):
     except:
         return datetime.now(timezone.utc)
 
-def fetch_rss_feeds():
-    """Fetch articles from all RSS feeds"""
+# Shared pooled HTTP transport (keep-alive per host, gzip/deflate/brotli decoding)
+http_pool = urllib3.PoolManager(
+    num_pools=HTTP_POOL_HOSTS,
+    maxsize=HTTP_POOL_SIZE,
+    headers={
+        **urllib3.util.make_headers(accept_encoding=True),
+        'User-Agent': USER_AGENT,
+        'Accept': 'application/rss+xml, application/atom+xml, application/xml;q=0.9, text/xml;q=0.9, */*;q=0.1',
+    },
+    timeout=urllib3.Timeout(connect=HTTP_CONNECT_TIMEOUT, read=HTTP_READ_TIMEOUT),
+    retries=urllib3.Retry(total=2, backoff_factor=0.5, raise_on_status=False),
+)
+
+def stream_feed(url, max_bytes=MAX_FEED_BYTES, headers=None):
+    """Yield decoded body chunks of a feed through the shared pool, refusing bodies larger than max_bytes
+    
+    If headers is a dict it is filled with the response headers feedparser uses.
+    """
+    response = http_pool.request('GET', url, preload_content=False, decode_content=True)
+    complete = False
+    
+    try:
+        if response.status >= 400:
+            raise ValueError(f"HTTP {response.status}")
+        
+        if headers is not None:
+            headers['content-type'] = response.headers.get('Content-Type', '')
+            headers['content-location'] = url
+        
+        declared = response.headers.get('Content-Length')
+        if declared and declared.isdigit() and response.headers.get('Content-Encoding') is None and int(declared) > max_bytes:
+            raise ValueError(f"response too large ({declared} bytes > {max_bytes})")
+        
+        size = 0
+        for chunk in response.stream(FEED_CHUNK_BYTES):
+            size += len(chunk)
+            if size > max_bytes:
+                raise ValueError(f"response too large (> {max_bytes} bytes)")
+            yield chunk
+        complete = True
+    finally:
+        # A partially read connection cannot be reused, so close it instead
+        if not complete:
+            response.close()
+        response.release_conn()
+
+def _qualified_name(tag):
+    """Split an ElementTree tag into (namespace, lowercased local name)"""
+    if not isinstance(tag, str):
+        return ('', '')
+    if tag.startswith('{'):
+        namespace, local = tag[1:].split('}', 1)
+        return (namespace, local.lower())
+    return ('', tag.lower())
+
+def _element_text(elem):
+    return ''.join(elem.itertext()).strip()
+
+def _entry_field(entry, elem):
+    """Copy one direct child of an RSS item / Atom entry into a feedparser-style entry dict"""
+    field = FEED_FIELD_TAGS.get(_qualified_name(elem.tag))
+    if field is None:
+        return
+    
+    if field == 'atom_link':
+        href = (elem.get('href') or '').strip()
+        if href and elem.get('rel', 'alternate') == 'alternate':
+            entry.setdefault('link', href)
+        return
+    
+    # Empty elements never claim a field
+    text = _element_text(elem)
+    if not text:
+        return
+    
+    if field == 'guid':
+        if elem.get('isPermaLink', 'true') != 'false' and text.startswith('http'):
+            entry.setdefault('guid_link', text)
+    elif field in FEED_DATE_FIELDS:
+        entry.setdefault('dates', {}).setdefault(field, text)
+    else:
+        entry.setdefault(field, text)
+
+def _finish_entry(entry):
+    """Resolve fallbacks the way feedparser does (guid permalink, content as summary, date priority)"""
+    if not entry.get('link') and entry.get('guid_link'):
+        entry['link'] = entry['guid_link']
+    if not entry.get('summary') and entry.get('content'):
+        entry['summary'] = entry['content']
+    dates = entry.pop('dates', {})
+    entry['published'] = next((dates[name] for name in FEED_DATE_FIELDS if dates.get(name)), None)
+    return entry
+
+def iter_feed_entries(url):
+    """Stream a feed and yield entries one by one as they are parsed
+    
+    Entries are parsed incrementally with XMLPullParser and discarded once
+    yielded, so closing the generator stops the download. Documents that are
+    not well-formed XML are fetched again and handed to feedparser.
+    """
+    parser = ElementTree.XMLPullParser(events=('start', 'end'))
+    chunks = stream_feed(url)
+    yielded = 0
+    stack = []
+    entry = None
+    
+    try:
+        for chunk in chunks:
+            try:
+                parser.feed(chunk)
+                for event, elem in parser.read_events():
+                    if event == 'start':
+                        if entry is None and _qualified_name(elem.tag) in FEED_ENTRY_TAGS:
+                            entry = {}
+                            entry_depth = len(stack)
+                        stack.append(elem)
+                        continue
+                    
+                    stack.pop()
+                    if entry is None:
+                        continue
+                    if len(stack) == entry_depth + 1:
+                        _entry_field(entry, elem)
+                    elif len(stack) == entry_depth:
+                        item = _finish_entry(entry)
+                        entry = None
+                        # Drop the parsed entry so memory stays flat for large feeds
+                        if stack:
+                            stack[-1].remove(elem)
+                        yielded += 1
+                        yield item
+            except ElementTree.ParseError:
+                break
+        else:
+            return
+        
+        # Malformed XML: re-fetch (only these feeds pay for a second request and
+        # a buffered body) and let feedparser recover the entries after those
+        # already yielded; both parsers return entries in document order
+        chunks.close()
+        headers = {}
+        body = b''.join(stream_feed(url, headers=headers))
+        feed = feedparser.parse(body, response_headers=headers)
+        yield from feed.entries[yielded:]
+    finally:
+        chunks.close()
+
+def jump_consistent_hash(key, buckets):
+    """Map an integer key to a bucket in [0, buckets) (Lamping & Veach jump consistent hash)"""
+    b, j = -1, 0
+    while j < buckets:
+        b = j
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        j = int((b + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return b
+
+def shard_for_feed(feed_config, shard_count):
+    """Return the shard index that owns a feed, keyed on its URL"""
+    key = int(hashlib.md5(feed_config['url'].encode()).hexdigest()[:16], 16)
+    return jump_consistent_hash(key, shard_count)
+
+def select_shard(feeds, shard_index, shard_count):
+    """Return the feeds belonging to one shard partition"""
+    return [f for f in feeds if shard_for_feed(f, shard_count) == shard_index]
+
+def parse_shard(spec):
+    """Parse an 'i/N' shard spec into (index, count) with 0 <= i < N"""
+    try:
+        index, count = (int(part) for part in spec.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid shard '{spec}', expected i/N")
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"invalid shard '{spec}', need 0 <= i < N")
+    return index, count
+
+def shard_store_path(shard_index, shard_count):
+    """Path of the partial article store for one shard"""
+    return os.path.join(SHARD_DIR, f'shard-{shard_index}-of-{shard_count}.jsonl')
+
+def fetch_rss_feeds(feeds=None, known_ids=None):
+    """Fetch new articles from RSS feeds (all of FEEDS by default)
+    
+    Articles whose id is in known_ids are skipped, and each feed stops
+    downloading after a streak of known articles.
+    """
     articles = []
+    full_texts = []
+    known_ids = set(known_ids or ())
     
-    for feed_config in FEEDS:
+    for feed_config in (FEEDS if feeds is None else feeds):
         print(f"Fetching {feed_config['name']} ({feed_config['region']})...")
         
+        streak_limit = feed_config.get('known_streak_limit', KNOWN_STREAK_LIMIT)
+        entries = iter_feed_entries(feed_config['url'])
+        known_streak = 0
+        
         try:
-            feed = feedparser.parse(feed_config['url'])
-            
-            for entry in feed.entries:
+            for entry in entries:
                 # Extract article data
                 title = entry.get('title', '')
                 url = entry.get('link', '')
-                published = parse_date(entry.get('published'))
-                summary = entry.get('summary', '') or entry.get('description', '')
                 
                 # Skip if essential data missing
                 if not title or not url:
                     continue
                 
+                # Skip articles seen in earlier runs, stopping after a run of them
+                article_id = generate_article_id(title, url)
+                if article_id in known_ids:
+                    known_streak += 1
+                    if streak_limit and known_streak >= streak_limit:
+                        print(f"  ⏩ {known_streak} known articles in a row, skipping rest of feed")
+                        break
+                    continue
+                known_streak = 0
+                known_ids.add(article_id)
+                
+                published = parse_date(entry.get('published'))
+                summary = entry.get('summary', '') or entry.get('description', '')
+                
                 # Combine title and summary for analysis
                 full_text = f"{title}. {summary}"
                 
-                # Enhanced classification
-                sentiment = classify_sentiment_enhanced(full_text)
+                # Enhanced classification (sentiment is scored in one batch below)
                 topic = classify_topic_enhanced(title, summary)
                 region = classify_region_enhanced(title, summary, feed_config['name'])
                 
                 article = {
-                    'id': generate_article_id(title, url),
+                    'id': article_id,
                     'title': title,
                     'url': url,
                     'source': feed_config['name'],
                     'region': region,  # Now uses enhanced classification
                     'published': published.isoformat(),
-                    'sentiment': sentiment['label'],
-                    'sentiment_score': sentiment['compound'],
+                    'sentiment': None,
+                    'sentiment_score': None,
                     'topic': topic,  # Now uses enhanced classification
                     'summary': summary
                 }
                 
                 articles.append(article)
+                full_texts.append(full_text)
                 
         except Exception as e:
             print(f"Error fetching {feed_config['name']}: {e}")
             continue
+        finally:
+            entries.close()
+    
+    for article, sentiment in zip(articles, classify_sentiment_batch(full_texts)):
+        article['sentiment'] = sentiment['label']
+        article['sentiment_score'] = sentiment['compound']
     
     return articles
 
-def load_existing_articles():
+def file_mode(path):
+    """Permission bits for rewriting path: the current file's, or 0666 minus the umask for new files"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+def atomic_write(path, text):
+    """Write text to path via a temp file and rename so readers never see partial output"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates 0600 files; keep the existing mode or use the umask default
+        os.chmod(tmp_path, file_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def write_text_if_changed(path, text):
+    """Atomically write text to path unless the file already holds the same content"""
+    if os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                if f.read() == text:
+                    return False
+        except (OSError, UnicodeDecodeError):
+            pass
+    
+    atomic_write(path, text)
+    return True
+
+def content_hash(data):
+    """Hash JSON output content, ignoring volatile top-level keys such as generated_at"""
+    if isinstance(data, dict):
+        data = {k: v for k, v in data.items() if k not in VOLATILE_KEYS}
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()
+
+def write_json_if_changed(path, data):
+    """Atomically write JSON output unless its substance matches the existing file"""
+    if os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                existing = json.load(f)
+            if content_hash(existing) == content_hash(data):
+                return False
+        except (OSError, ValueError):
+            pass
+    
+    atomic_write(path, json.dumps(data, indent=2))
+    return True
+
+def load_existing_articles(path=RAW_PATH):
     """Load existing articles from raw data file"""
     articles = []
     
-    if os.path.exists(RAW_PATH):
+    if os.path.exists(path):
         try:
-            with open(RAW_PATH, 'r', encoding='utf-8') as f:
+            with open(path, 'r', encoding='utf-8') as f:
                 for line in f:
                     if line.strip():
                         article = json.loads(line)
@@ -479,13 +752,34 @@ def load_existing_articles():
     
     return articles
 
-def save_articles(articles):
+def save_articles(articles, path=RAW_PATH):
     """Save articles to raw data file"""
-    os.makedirs(os.path.dirname(RAW_PATH), exist_ok=True)
+    text = ''.join(json.dumps(article) + '\n' for article in articles)
+    return write_text_if_changed(path, text)
+
+def merge_articles(existing_articles, new_articles):
+    """Append new articles to existing ones, skipping ids already present"""
+    all_articles = existing_articles.copy()
+    seen_ids = {a['id'] for a in existing_articles}
+    
+    for article in new_articles:
+        if article['id'] not in seen_ids:
+            seen_ids.add(article['id'])
+            all_articles.append(article)
     
-    with open(RAW_PATH, 'w', encoding='utf-8') as f:
-        for article in articles:
-            f.write(json.dumps(article) + '\n')
+    return all_articles
+
+def load_partial_stores(paths):
+    """Load shard stores and dedupe by article id, independent of file or line order"""
+    candidates = {}
+    
+    for path in sorted(paths):
+        for article in load_existing_articles(path):
+            current = candidates.get(article['id'])
+            if current is None or (article['published'], article['source']) < (current['published'], current['source']):
+                candidates[article['id']] = article
+    
+    return sorted(candidates.values(), key=lambda a: (a['published'], a['id']))
 
 def filter_recent_articles(articles, hours=24):
     """Filter articles from last N hours"""
@@ -612,10 +906,13 @@ def save_all_headlines(articles):
         ]
     }
     
-    with open(ALL_HEADLINES_PATH, 'w', encoding='utf-8') as f:
-        json.dump(headlines_data, f, indent=2)
+    changed = write_json_if_changed(ALL_HEADLINES_PATH, headlines_data)
     
-    print(f"📰 Saved {len(all_headlines)} headlines to all_headlines.json")
+    if changed:
+        print(f"📰 Saved {len(all_headlines)} headlines to all_headlines.json")
+    else:
+        print(f"📰 all_headlines.json unchanged ({len(all_headlines)} headlines)")
+    return changed
 
 def generate_history_data(articles):
     """Generate daily sentiment history for the last 7 days"""
@@ -641,30 +938,16 @@ def generate_history_data(articles):
     
     return list(reversed(history))
 
-def main():
-    """Main execution function"""
-    print("🔄 Fetching news articles with enhanced classification...")
-    
-    # Fetch new articles
-    new_articles = fetch_rss_feeds()
-    print(f"📰 Fetched {len(new_articles)} new articles")
-    
-    # Load existing articles
-    existing_articles = load_existing_articles()
-    print(f"📚 Loaded {len(existing_articles)} existing articles")
-    
-    # Combine and deduplicate
-    all_articles = existing_articles.copy()
-    existing_ids = {a['id'] for a in existing_articles}
-    
-    for article in new_articles:
-        if article['id'] not in existing_ids:
-            all_articles.append(article)
-    
+def build_outputs(all_articles):
+    """Write the raw store and dashboard outputs, returning the paths that changed"""
     print(f"📊 Total unique articles: {len(all_articles)}")
     
+    # Track which outputs actually changed this run
+    changed_outputs = []
+    
     # Save all articles
-    save_articles(all_articles)
+    if save_articles(all_articles):
+        changed_outputs.append(RAW_PATH)
     
     # Generate latest dashboard data (last 24 hours)
     recent_articles = filter_recent_articles(all_articles, hours=24)
@@ -672,16 +955,17 @@ def main():
     
     latest_stats = generate_statistics(recent_articles)
     
+    # Ensure output directory exists
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    
     # Save ALL recent headlines for the headlines editor
-    save_all_headlines(recent_articles)
+    if save_all_headlines(recent_articles):
+        changed_outputs.append(ALL_HEADLINES_PATH)
     
     # Generate history data (last 7 days)
     week_articles = filter_recent_articles(all_articles, hours=24*ROLLING_DAYS)
     history_data = generate_history_data(week_articles)
     
-    # Ensure output directory exists
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    
     # Save latest data
     latest_output = {
         'generated_at': datetime.now(timezone.utc).isoformat(),
@@ -689,8 +973,8 @@ def main():
         **latest_stats
     }
     
-    with open(LATEST_PATH, 'w', encoding='utf-8') as f:
-        json.dump(latest_output, f, indent=2)
+    if write_json_if_changed(LATEST_PATH, latest_output):
+        changed_outputs.append(LATEST_PATH)
     
     # Save history data
     history_output = {
@@ -698,13 +982,80 @@ def main():
         'history': history_data
     }
     
-    with open(HISTORY_PATH, 'w', encoding='utf-8') as f:
-        json.dump(history_output, f, indent=2)
+    if write_json_if_changed(HISTORY_PATH, history_output):
+        changed_outputs.append(HISTORY_PATH)
     
-    print(f"✅ Enhanced dashboard data updated!")
+    if changed_outputs:
+        print(f"✅ Enhanced dashboard data updated: {', '.join(changed_outputs)}")
+    else:
+        print("✅ No output changes - dashboard data already up to date")
     print(f"📈 Sentiment distribution: {latest_stats['totals']}")
     print(f"🌍 Regions covered: {len(latest_stats['by_region'])}")
     print(f"📋 Topics covered: {len(latest_stats['by_topic'])}")
+    
+    return changed_outputs
+
+def run_shard(shard_index, shard_count):
+    """Fetch and classify one shard of FEEDS into its partial store"""
+    feeds = select_shard(FEEDS, shard_index, shard_count)
+    print(f"🔄 Shard {shard_index}/{shard_count}: fetching {len(feeds)} of {len(FEEDS)} feeds...")
+    
+    path = shard_store_path(shard_index, shard_count)
+    existing_articles = load_existing_articles(path)
+    
+    new_articles = fetch_rss_feeds(feeds, known_ids={a['id'] for a in existing_articles})
+    print(f"📰 Fetched {len(new_articles)} new articles")
+    
+    # Keep the partial store bounded to the rolling window
+    articles = merge_articles(existing_articles, new_articles)
+    articles = filter_recent_articles(articles, hours=24*ROLLING_DAYS)
+    
+    if save_articles(articles, path):
+        print(f"✅ Wrote {len(articles)} articles to {path}")
+    else:
+        print(f"✅ {path} unchanged ({len(articles)} articles)")
+
+def run_merge(paths=None):
+    """Merge shard partial stores into the raw store and dashboard outputs"""
+    if not paths:
+        paths = glob.glob(os.path.join(SHARD_DIR, '*.jsonl'))
+    print(f"🔄 Merging {len(paths)} partial stores...")
+    
+    new_articles = load_partial_stores(paths)
+    print(f"📰 Loaded {len(new_articles)} unique shard articles")
+    
+    existing_articles = load_existing_articles()
+    print(f"📚 Loaded {len(existing_articles)} existing articles")
+    
+    build_outputs(merge_articles(existing_articles, new_articles))
+
+def main():
+    """Main execution function"""
+    print("🔄 Fetching news articles with enhanced classification...")
+    
+    # Load existing articles
+    existing_articles = load_existing_articles()
+    print(f"📚 Loaded {len(existing_articles)} existing articles")
+    
+    # Fetch new articles
+    new_articles = fetch_rss_feeds(known_ids={a['id'] for a in existing_articles})
+    print(f"📰 Fetched {len(new_articles)} new articles")
+    
+    # Combine and deduplicate
+    build_outputs(merge_articles(existing_articles, new_articles))
 
 if __name__ == "__main__":
-    main()
+    arg_parser = argparse.ArgumentParser(description="Fetch news feeds and build sentiment dashboard data")
+    mode = arg_parser.add_mutually_exclusive_group()
+    mode.add_argument('--shard', type=parse_shard, metavar='i/N',
+                      help="fetch only shard i of N (0-based) into its partial store under data/shards")
+    mode.add_argument('--merge', nargs='*', metavar='STORE',
+                      help="merge partial stores (default: all in data/shards) into the dashboard outputs")
+    args = arg_parser.parse_args()
+    
+    if args.shard:
+        run_shard(*args.shard)
+    elif args.merge is not None:
+        run_merge(args.merge)
+    else:
+        main()
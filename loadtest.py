@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Local mock RSS farm and end-to-end load harness for fetcher.py.
+
+This script starts a local HTTP server publishing N synthetic RSS/Atom feeds,
+points fetcher.FEEDS at it and runs the full main() pipeline repeatedly in a
+scratch directory, so real publishers and the committed docs/data files are
+never touched.
+
+The synthetic feeds mimic real-world behaviour:
+  - RSS 2.0 and Atom documents with 10-60 entries each
+  - churn: every fetch of a feed publishes a few new entries
+  - slow responders that delay their response
+  - feeds that answer 304 Not Modified after their first fetch
+  - malformed XML (truncated documents, undefined entities)
+
+For each feed count it reports wall time, CPU time, peak memory (RSS) and
+output sizes per run, to show where the pipeline stops scaling.
+
+Usage:
+    python loadtest.py [--sizes 10 100 1000] [--runs 3] [--seed 42]
+
+Each feed count runs in a fresh process so peak memory is measured per size.
+Peak memory comes from the resource module on Linux/macOS; on Windows it needs
+psutil installed and is reported as n/a otherwise.
+"""
+
+import argparse
+import http.server
+import multiprocessing
+import os
+import queue
+import random
+import shutil
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+REPO_DIR = Path(__file__).resolve().parent
+
+# ru_maxrss is reported in bytes on macOS and in kilobytes on Linux
+MAXRSS_PER_MB = 1024 * 1024 if sys.platform == 'darwin' else 1024
+
+MIN_FEEDS = 10
+MAX_FEEDS = 5000
+
+# Fractions of feeds with each misbehaviour
+SLOW_FRACTION = 0.05
+NOT_MODIFIED_FRACTION = 0.05
+MALFORMED_FRACTION = 0.03
+
+POSITIVE_WORDS = ['wins', 'celebrates', 'breakthrough', 'recovery', 'peace deal', 'record growth', 'award', 'rescue']
+NEGATIVE_WORDS = ['crisis', 'collapse', 'attack', 'scandal', 'disaster', 'fraud', 'killed', 'severe storm']
+NEUTRAL_WORDS = ['announces', 'reviews', 'discusses', 'schedules', 'updates', 'reports on', 'meets', 'considers']
+SUBJECTS = ['Government', 'City council', 'Tech giant', 'Local team', 'Scientists', 'Central bank',
+            'Hospital', 'Film studio', 'Parliament', 'Startup', 'Premier League club', 'NASA']
+PLACES = ['London', 'Tokyo', 'Nairobi', 'Toronto', 'Sao Paulo', 'Berlin', 'Mumbai', 'Sydney', 'Cairo', 'Texas']
+
+
+def feed_profile(index, seed):
+    """Deterministic behaviour profile for synthetic feed number index"""
+    rng = random.Random(f"{seed}:{index}")
+    return {
+        'format': 'atom' if rng.random() < 0.3 else 'rss',
+        'entries': rng.randint(10, 60),
+        'churn': rng.randint(0, 5),
+        'delay': rng.uniform(0.5, 2.0) if rng.random() < SLOW_FRACTION else 0.0,
+        'not_modified': rng.random() < NOT_MODIFIED_FRACTION,
+        'malformed': rng.random() < MALFORMED_FRACTION,
+    }
+
+
+def make_entries(index, profile, fetch_count, seed):
+    """Build the entries visible on the given fetch, newest first"""
+    newest = profile['entries'] + fetch_count * profile['churn']
+    now = datetime.now(timezone.utc)
+    entries = []
+
+    for k in range(newest, newest - profile['entries'], -1):
+        rng = random.Random(f"{seed}:{index}:{k}")
+        mood = rng.choice([POSITIVE_WORDS, NEGATIVE_WORDS, NEUTRAL_WORDS])
+        title = f"{rng.choice(SUBJECTS)} {rng.choice(mood)} in {rng.choice(PLACES)}"
+        summary = f"{title}. {rng.choice(SUBJECTS)} {rng.choice(NEUTRAL_WORDS)} the story as it develops."
+        entries.append({
+            'title': f"{title} ({index}-{k})",
+            'link': f"https://mock.example/{index}/{k}",
+            'summary': summary,
+            'published': now - timedelta(minutes=(newest - k) * 15),
+        })
+
+    return entries
+
+
+def render_feed(index, profile, entries):
+    """Render entries as an RSS 2.0 or Atom document"""
+    if profile['format'] == 'atom':
+        items = ''.join(
+            f"<entry><title>{escape(e['title'])}</title>"
+            f"<link href=\"{escape(e['link'])}\"/><id>{escape(e['link'])}</id>"
+            f"<updated>{e['published'].isoformat()}</updated>"
+            f"<summary>{escape(e['summary'])}</summary></entry>"
+            for e in entries
+        )
+        doc = (f'<?xml version="1.0" encoding="utf-8"?>'
+               f'<feed xmlns="http://www.w3.org/2005/Atom"><title>Mock Feed {index}</title>{items}</feed>')
+    else:
+        items = ''.join(
+            f"<item><title>{escape(e['title'])}</title><link>{escape(e['link'])}</link>"
+            f"<pubDate>{format_datetime(e['published'])}</pubDate>"
+            f"<description>{escape(e['summary'])}</description></item>"
+            for e in entries
+        )
+        doc = (f'<?xml version="1.0" encoding="utf-8"?>'
+               f'<rss version="2.0"><channel><title>Mock Feed {index}</title>{items}</channel></rss>')
+
+    if profile['malformed']:
+        # Undefined entity plus a truncated tail
+        doc = doc.replace('<title>', '<title>&bogus; ', 1)[:int(len(doc) * 0.8)]
+
+    return doc.encode('utf-8')
+
+
+class FeedFarmHandler(http.server.BaseHTTPRequestHandler):
+    """Serves /feed/<i>.xml for the synthetic feeds"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        farm = self.server
+        try:
+            index = int(self.path.rsplit('/', 1)[-1].split('.')[0])
+        except ValueError:
+            index = -1
+        if not 0 <= index < farm.feed_count:
+            self.send_error(404)
+            return
+
+        profile = feed_profile(index, farm.seed)
+        with farm.lock:
+            fetch_count = farm.fetch_counts.get(index, 0)
+            farm.fetch_counts[index] = fetch_count + 1
+
+        if profile['delay']:
+            time.sleep(profile['delay'])
+
+        if profile['not_modified'] and fetch_count > 0:
+            self.send_response(304)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = render_feed(index, profile, make_entries(index, profile, fetch_count, farm.seed))
+        content_type = 'application/atom+xml' if profile['format'] == 'atom' else 'application/rss+xml'
+        self.send_response(200)
+        self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FeedFarmServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, feed_count, seed):
+        super().__init__(address, FeedFarmHandler)
+        self.feed_count = feed_count
+        self.seed = seed
+        self.lock = threading.Lock()
+        self.fetch_counts = {}
+
+    def handle_error(self, request, client_address):
+        # Clients that stop reading a feed early reset the connection; that is expected
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+
+def serve_farm(port, feed_count, seed, ready):
+    """Run the mock feed farm (in its own process so it does not skew measurements)"""
+    with FeedFarmServer(('127.0.0.1', port), feed_count, seed) as server:
+        ready.set()
+        server.serve_forever()
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process in MB, or None where it cannot be measured"""
+    try:
+        import resource
+    except ImportError:
+        # Windows: no resource module; psutil reports the peak working set if installed
+        try:
+            import psutil
+        except ImportError:
+            return None
+        info = psutil.Process().memory_info()
+        return getattr(info, 'peak_wset', info.rss) / (1024 * 1024)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / MAXRSS_PER_MB
+
+
+def output_sizes(workdir):
+    """Total size in bytes of the raw store and dashboard outputs"""
+    total = 0
+    for path in [Path(workdir) / 'data' / 'raw.jsonl', *(Path(workdir) / 'docs' / 'data').glob('*.json')]:
+        if path.exists():
+            total += path.stat().st_size
+    return total
+
+
+def run_pipeline(base_url, feed_count, runs, results):
+    """Run fetcher.main() repeatedly against the farm and report per-run metrics"""
+    os.chdir(REPO_DIR)
+    sys.path.insert(0, str(REPO_DIR))
+    import fetcher
+
+    fetcher.FEEDS = [
+        {'name': f"Mock Feed {i}", 'url': f"{base_url}/feed/{i}.xml", 'region': 'Global'}
+        for i in range(feed_count)
+    ]
+
+    workdir = tempfile.mkdtemp(prefix='gnbn-load-')
+    os.chdir(workdir)
+    devnull = open(os.devnull, 'w')
+
+    try:
+        for run in range(1, runs + 1):
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                fetcher.main()
+            finally:
+                sys.stdout = stdout
+
+            results.put({
+                'feeds': feed_count,
+                'run': run,
+                'wall': time.perf_counter() - wall_start,
+                'cpu': time.process_time() - cpu_start,
+                'articles': len(fetcher.load_existing_articles()),
+                'peak_rss_mb': peak_rss_mb(),
+                'output_kb': output_sizes(workdir) / 1024,
+            })
+    finally:
+        devnull.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def feed_count_arg(value):
+    count = int(value)
+    if not MIN_FEEDS <= count <= MAX_FEEDS:
+        raise argparse.ArgumentTypeError(f"feed count must be between {MIN_FEEDS} and {MAX_FEEDS}")
+    return count
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="End-to-end load test of fetcher.py against a mock RSS farm")
+    arg_parser.add_argument('--sizes', type=feed_count_arg, nargs='+', default=[10, 100, 500, 1000],
+                            help=f"feed counts to test ({MIN_FEEDS}-{MAX_FEEDS})")
+    arg_parser.add_argument('--runs', type=int, default=3, help="pipeline runs per feed count")
+    arg_parser.add_argument('--port', type=int, default=8765, help="port for the mock feed farm")
+    arg_parser.add_argument('--seed', type=int, default=42, help="seed for synthetic feed content")
+    args = arg_parser.parse_args()
+
+    ctx = multiprocessing.get_context('spawn')
+    rows = []
+
+    print(f"\n{'feeds':>6} {'run':>4} {'wall s':>8} {'cpu s':>8} {'articles':>9} {'peak MB':>8} {'out KB':>9}")
+
+    for feed_count in args.sizes:
+        # Fresh farm per size so churn starts from the first fetch
+        ready = ctx.Event()
+        farm = ctx.Process(target=serve_farm, args=(args.port, feed_count, args.seed, ready), daemon=True)
+        farm.start()
+        if not ready.wait(10):
+            farm.terminate()
+            print(f"❌ Mock feed farm failed to start on port {args.port}")
+            return
+
+        results = ctx.Queue()
+        worker = ctx.Process(target=run_pipeline,
+                             args=(f"http://127.0.0.1:{args.port}", feed_count, args.runs, results))
+        worker.start()
+
+        completed = 0
+        while completed < args.runs:
+            try:
+                row = results.get(timeout=1)
+            except queue.Empty:
+                if not worker.is_alive():
+                    print(f"❌ Pipeline worker for {feed_count} feeds exited early (code {worker.exitcode})")
+                    break
+                continue
+            completed += 1
+            rows.append(row)
+            peak = 'n/a' if row['peak_rss_mb'] is None else f"{row['peak_rss_mb']:.1f}"
+            print(f"{row['feeds']:>6} {row['run']:>4} {row['wall']:>8.2f} {row['cpu']:>8.2f} "
+                  f"{row['articles']:>9} {peak:>8} {row['output_kb']:>9.1f}")
+
+        worker.join()
+        farm.terminate()
+        farm.join()
+
+    # Per-feed cost of the first (cold) run, to spot super-linear growth
+    print("\nCold-run cost per feed:")
+    for row in rows:
+        if row['run'] == 1:
+            print(f"  {row['feeds']:>5} feeds: {row['wall'] / row['feeds'] * 1000:.1f} ms wall, "
+                  f"{row['cpu'] / row['feeds'] * 1000:.1f} ms cpu")
+
+
+if __name__ == "__main__":
+    main()
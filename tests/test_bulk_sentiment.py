@@ -0,0 +1,81 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_DIR))
+
+from bulk_sentiment import COMPOUND_TOLERANCE, BulkSentimentScorer
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return SentimentIntensityAnalyzer()
+
+
+@pytest.fixture(scope='module')
+def scorer(analyzer):
+    return BulkSentimentScorer(analyzer)
+
+
+def corpus_texts():
+    with open(REPO_DIR / 'data' / 'all_headlines.json', 'r', encoding='utf-8') as f:
+        headlines = json.load(f)['headlines']
+    # Same text construction as fetcher.classify_sentiment_enhanced(f"{title}. {summary}")
+    return [f"{h['title']}. {h.get('summary', '')}. " for h in headlines]
+
+
+EDGE_CASES = [
+    "",
+    "   ",
+    "😁",
+    "💘 💋",
+    "Catch utf-8 emoji such as 💘 and 💋 and 😁",
+    "VADER is VERY SMART, uber handsome, and FRIGGIN FUNNY!!!",
+    "GOOD NEWS EVERYONE",
+    "The plot was good, but the characters are uncompelling and the dialog is not great.",
+    "good good but good good bad bad but",
+    "The book was only kind of good.",
+    "He is sort of happy and just enough sad",
+    "At least it isn't a horrible book.",
+    "Roger Dodger is one of the least compelling variations on this theme.",
+    "Without a doubt, excellent idea.",
+    "Sentiment analysis has never been this good!",
+    "no good no bad",
+    "competent disgusted distracts",
+    "WHY?? ?? !!!!! great",
+]
+
+
+def assert_matches(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        assert set(a) == set(e)
+        assert abs(a['compound'] - e['compound']) <= COMPOUND_TOLERANCE
+        for key in ('neg', 'neu', 'pos', 'compound'):
+            assert type(a[key]) is float
+            assert a[key] == e[key], (key, a, e)
+
+
+def test_matches_polarity_scores_on_headline_corpus(analyzer, scorer):
+    texts = corpus_texts()
+    assert_matches(scorer.polarity_scores_batch(texts), [analyzer.polarity_scores(t) for t in texts])
+
+
+def test_matches_polarity_scores_on_edge_cases(analyzer, scorer):
+    assert_matches(scorer.polarity_scores_batch(EDGE_CASES), [analyzer.polarity_scores(t) for t in EDGE_CASES])
+
+
+def test_empty_batch(scorer):
+    assert scorer.polarity_scores_batch([]) == []
+    assert scorer.polarity_scores_batch(["", " "]) == [{'neg': 0.0, 'neu': 0.0, 'pos': 0.0, 'compound': 0.0}] * 2
+
+
+def test_unseen_tokens_do_not_grow_vocabulary(analyzer, scorer):
+    size = len(scorer.vocab)
+    texts = ["qwertyfoo isn't zorblax good", "zorblax never blorfed"]
+    assert_matches(scorer.polarity_scores_batch(texts), [analyzer.polarity_scores(t) for t in texts])
+    assert len(scorer.vocab) == size
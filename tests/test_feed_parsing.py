@@ -0,0 +1,149 @@
+import http.server
+import importlib
+import os
+import sys
+import threading
+from pathlib import Path
+
+import feedparser
+import pytest
+
+REPO_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_DIR))
+
+NAMESPACES = (
+    'xmlns:media="http://search.yahoo.com/mrss/" '
+    'xmlns:content="http://purl.org/rss/1.0/modules/content/" '
+    'xmlns:dc="http://purl.org/dc/elements/1.1/" '
+    'xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd" '
+    'xmlns:atom="http://www.w3.org/2005/Atom"'
+)
+
+FEEDS = {
+    # Namespaced children that share a local name with a standard field
+    'namespaced': f'''<?xml version="1.0"?><rss version="2.0" {NAMESPACES}><channel><title>T</title>
+        <item><media:title>Photo caption</media:title><title>Real headline</title>
+            <link>http://x/1</link><description>Desc one</description>
+            <pubDate>Mon, 19 Oct 2026 10:00:00 GMT</pubDate></item>
+        <item><title>Body only</title><link>http://x/2</link><media:content url="http://img/2.jpg"/>
+            <content:encoded><![CDATA[<p>Full body</p>]]></content:encoded></item>
+        <item><atom:link rel="self" href="http://self/3"/><title>Dated</title><link>http://x/3</link>
+            <dc:date>2026-10-18T01:00:00Z</dc:date></item>
+    </channel></rss>''',
+
+    'cdata': '''<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>
+        <item><title><![CDATA[Markets & <b>stocks</b> rally]]></title><link>http://c/1</link>
+            <description><![CDATA[<p>Shares <em>jumped</em> today</p>]]></description></item>
+        <item><title>Guid only</title><guid>http://c/guid</guid><description>Plain &amp; simple</description></item>
+    </channel></rss>''',
+
+    'atom': '''<?xml version="1.0" encoding="utf-8"?><feed xmlns="http://www.w3.org/2005/Atom"><title>A</title>
+        <entry><title>Self first</title><link rel="self" href="http://a/self/1"/>
+            <link rel="alternate" href="http://a/1"/><updated>2026-10-19T10:00:00Z</updated>
+            <summary>Sum one</summary></entry>
+        <entry><title>No rel</title><link rel="enclosure" href="http://a/audio.mp3"/><link href="http://a/2"/>
+            <published>2026-10-19T09:00:00Z</published><content type="html">Content two</content></entry>
+        <entry><title type="html">Escaped &lt;b&gt;title&lt;/b&gt;</title><link href="http://a/3"/>
+            <updated>2026-10-19T08:00:00Z</updated><summary>Sum three</summary>
+            <source><title>Source feed title</title></source></entry>
+    </feed>''',
+
+    'rdf': '''<?xml version="1.0"?><rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+        xmlns="http://purl.org/rss/1.0/" xmlns:dc="http://purl.org/dc/elements/1.1/">
+        <channel><title>R</title></channel>
+        <item rdf:about="http://r/1"><title>RDF one</title><link>http://r/1</link>
+            <dc:date>2026-10-19T10:00:00Z</dc:date><description>R desc</description></item>
+    </rdf:RDF>''',
+
+    # Undefined HTML entity: the stream parser fails mid-document and falls back to feedparser
+    'malformed': '''<?xml version="1.0"?><rss version="2.0"><channel><title>M</title>
+        <item><title>Fine one</title><link>http://m/1</link><description>ok</description></item>
+        <item><title>Broken&nbsp;two</title><link>http://m/2</link><description>bad</description></item>
+        <item><title>Three</title><link>http://m/3</link><description>after</description></item>
+    </channel></rss>''',
+
+    # Elements outside RSS/Atom/content:encoded/dc:date never take over fields
+    'ignored': f'''<?xml version="1.0"?><rss version="2.0" {NAMESPACES}><channel><title>T</title>
+        <item><dc:title>DC title</dc:title><title>Headline</title><link>http://i/1</link>
+            <itunes:summary>Itunes summary</itunes:summary><description>Real desc</description></item>
+        <item><title>Caption only</title><link>http://i/2</link>
+            <media:description>Photo caption</media:description></item>
+        <item><title></title><link>http://i/3</link><description>Untitled</description></item>
+    </channel></rss>''',
+}
+
+
+@pytest.fixture(scope='module')
+def fetcher():
+    # fetcher reads feeds.json relative to the working directory on import
+    cwd = os.getcwd()
+    os.chdir(REPO_DIR)
+    try:
+        yield importlib.import_module('fetcher')
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture(scope='module')
+def feed_url():
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = FEEDS[self.path.strip('/')].encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/rss+xml; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield lambda name: f"http://127.0.0.1:{server.server_port}/{name}"
+    server.shutdown()
+
+
+def fields(entry):
+    return (
+        entry.get('title'),
+        entry.get('link'),
+        entry.get('summary'),
+        entry.get('published') or entry.get('updated'),
+    )
+
+
+def reference(name):
+    return [fields(e) for e in feedparser.parse(FEEDS[name].encode('utf-8')).entries]
+
+
+@pytest.mark.parametrize('name', ['namespaced', 'cdata', 'atom', 'rdf', 'malformed'])
+def test_stream_parser_matches_feedparser(fetcher, feed_url, name):
+    assert [fields(e) for e in fetcher.iter_feed_entries(feed_url(name))] == reference(name)
+
+
+def test_namespaced_children_do_not_take_over_fields(fetcher, feed_url):
+    entries = list(fetcher.iter_feed_entries(feed_url('namespaced')))
+    assert entries[0]['title'] == 'Real headline'
+    assert entries[1]['summary'] == '<p>Full body</p>'
+    assert entries[2]['link'] == 'http://x/3'
+    assert entries[2]['published'] == '2026-10-18T01:00:00Z'
+
+
+def test_atom_links_use_alternate_rel(fetcher, feed_url):
+    links = [e['link'] for e in fetcher.iter_feed_entries(feed_url('atom'))]
+    assert links == ['http://a/1', 'http://a/2', 'http://a/3']
+
+
+def test_malformed_feed_falls_back_without_duplicates(fetcher, feed_url):
+    titles = [e.get('title') for e in fetcher.iter_feed_entries(feed_url('malformed'))]
+    assert titles == ['Fine one', 'Broken\xa0two', 'Three']
+
+
+def test_other_namespaces_and_empty_elements_are_ignored(fetcher, feed_url):
+    entries = list(fetcher.iter_feed_entries(feed_url('ignored')))
+    assert [(e.get('title'), e.get('summary')) for e in entries] == [
+        ('Headline', 'Real desc'),
+        ('Caption only', None),
+        (None, 'Untitled'),
+    ]